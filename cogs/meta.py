@@ -5,16 +5,89 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
 import inspect
-import json
 import os
 import textwrap
 import unicodedata
 from collections import Counter
+from functools import lru_cache
+from itertools import compress
 from typing import Union
 
 import discord
+import orjson
 from discord.ext import commands
-from utils import checks, formats, time
+from utils import cache, checks, formats, time
+
+ALL_FEATURES = {
+    "PARTNERED": "Partnered",
+    "VERIFIED": "Verified",
+    "DISCOVERABLE": "Server Discovery",
+    "COMMUNITY": "Community Server",
+    "FEATURED": "Featured.",
+    "WELCOME_SCREEN_ENABLED": "Welcome Screen",
+    "INVITE_SPLASH": "Invite Splash",
+    "VIP_REGIONS": "VIP Voice Servers",
+    "VANITY_URL": "Vanity Invite",
+    "COMMERCE": "Commerce",
+    "LURKABLE": "Lurkable",
+    "NEWS": "News Channels",
+    "ANIMATED_ICON": "Animated Icon",
+    "BANNER": "Banner",
+}
+
+CHANNEL_EMOJI = {
+    discord.TextChannel: "<:TextChannel:745076999160070296>",
+    discord.VoiceChannel: "<:VoiceChannel:745077018080575580>",
+}
+
+READ_MESSAGES = discord.Permissions.read_messages.flag
+VOICE_ACCESS = discord.Permissions.connect.flag | discord.Permissions.speak.flag
+
+# in the same order that iterating a discord.Permissions yields them
+PERMISSION_NAMES = tuple(
+    name.replace("_", " ").replace("guild", "server").title()
+    for name, _ in discord.Permissions.none()
+)
+
+ASCII_NAMES = {
+    chr(i): unicodedata.name(chr(i))
+    for i in range(128)
+    if unicodedata.name(chr(i), None)
+}
+
+JOIN_MESSAGE = textwrap.dedent(
+    """
+    Okay you have two options:
+    Invite me with managed permissions [here]({managed} 'WARNING: Creates a managed role in your server.').
+    or...
+    Invite me with no permissions, and you handle it with your own roles.
+    [I can't promise I'll work until you fix my perms.]({free} 'I prefer this option, personally.').
+    """
+)
+
+# users looked up over the API, so repeat lookups skip the HTTP request
+FETCHED_USERS = cache.ExpiringCache(seconds=3600.0)
+
+
+def _format_roles(roles):
+    if len(roles) >= 10:
+        return f"{len(roles)} roles"
+    return ", ".join(role.name.replace("@", "@\u200b") for role in roles)
+
+
+@lru_cache(maxsize=256)
+def _get_source_file(obj):
+    return inspect.getsourcefile(obj)
+
+
+@lru_cache(maxsize=256)
+def _get_source_lines(obj):
+    return inspect.getsourcelines(obj)
+
+
+@lru_cache(maxsize=256)
+def _get_relative_path(filename):
+    return os.path.relpath(filename).replace("\\", "/")
 
 
 class Prefix(commands.Converter):
@@ -29,8 +102,14 @@ class FetchedUser(commands.Converter):
     async def convert(self, ctx, argument):
         if not argument.isdigit():
             raise commands.BadArgument("Not a valid user ID.")
+
+        user_id = int(argument)
+        if user_id in FETCHED_USERS:
+            user, _ = FETCHED_USERS[user_id]
+            return user
+
         try:
-            return await ctx.bot.fetch_user(argument)
+            user = await ctx.bot.fetch_user(user_id)
         except discord.NotFound:
             raise commands.BadArgument("User not found.") from None
         except discord.HTTPException:
@@ -38,6 +117,9 @@ class FetchedUser(commands.Converter):
                 "An error occurred while fetching the user."
             ) from None
 
+        FETCHED_USERS[user_id] = user
+        return user
+
 
 class Meta(commands.Cog):
     """Commands for utilities related to Discord or the Bot itself."""
@@ -45,6 +127,15 @@ class Meta(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    @discord.utils.cached_property
+    def join_message(self):
+        perms = discord.Permissions.all()
+        perms.administrator = False
+        return JOIN_MESSAGE.format(
+            managed=discord.utils.oauth_url(self.bot.user.id, perms),
+            free=discord.utils.oauth_url(self.bot.user.id),
+        )
+
     async def cog_command_error(self, ctx, error):
         if isinstance(error, commands.BadArgument):
             await ctx.send(error)
@@ -58,7 +149,7 @@ class Meta(commands.Cog):
 
         def to_string(c):
             digit = f"{ord(c):x}"
-            name = unicodedata.name(c, "Name not found.")
+            name = ASCII_NAMES.get(c) or unicodedata.name(c, "Name not found.")
             return f"`\\U{digit:>08}`: {name} - {c} \N{EM DASH} <http://www.fileformat.info/info/unicode/char/{digit}>"
 
         msg = "\n".join(map(to_string, characters))
@@ -173,7 +264,7 @@ class Meta(commands.Cog):
         if command == "help":
             src = type(self.bot.help_command)
             module = src.__module__
-            filename = inspect.getsourcefile(src)
+            filename = _get_source_file(src)
         else:
             obj = self.bot.get_command(command.replace(".", " "))
             if obj is None:
@@ -185,10 +276,10 @@ class Meta(commands.Cog):
             module = obj.callback.__module__
             filename = src.co_filename
 
-        lines, firstlineno = inspect.getsourcelines(src)
+        lines, firstlineno = _get_source_lines(src)
         if not module.startswith("discord"):
             # not a built-in command
-            location = os.path.relpath(filename).replace("\\", "/")
+            location = _get_relative_path(filename)
         else:
             location = module.replace(".", "/") + ".py"
             source_url = "https://github.com/Rapptz/discord.py"
@@ -216,10 +307,8 @@ class Meta(commands.Cog):
             user = ctx.guild.get_member(user.id) or user
 
         e = discord.Embed()
-        roles = [
-            role.name.replace("@", "@\u200b") for role in getattr(user, "roles", [])
-        ]
-        shared = sum(g.get_member(user.id) is not None for g in self.bot.guilds)
+        roles = getattr(user, "roles", [])
+        shared = len(user.mutual_guilds)
         e.set_author(name=str(user))
 
         def format_date(dt):
@@ -248,11 +337,7 @@ class Meta(commands.Cog):
             e.add_field(name="Voice", value=voice, inline=False)
 
         if roles:
-            e.add_field(
-                name="Roles",
-                value=", ".join(roles) if len(roles) < 10 else f"{len(roles)} roles",
-                inline=False,
-            )
+            e.add_field(name="Roles", value=_format_roles(roles), inline=False)
 
         colour = user.colour
         if colour.value:
@@ -278,8 +363,6 @@ class Meta(commands.Cog):
         else:
             guild = ctx.guild
 
-        roles = [role.name.replace("@", "@\u200b") for role in guild.roles]
-
         # figure out what channels are 'secret'
         everyone = guild.default_role
         everyone_perms = everyone.permissions.value
@@ -287,17 +370,29 @@ class Meta(commands.Cog):
         totals = Counter()
         for channel in guild.channels:
             allow, deny = channel.overwrites_for(everyone).pair()
-            perms = discord.Permissions((everyone_perms & ~deny.value) | allow.value)
+            perms = (everyone_perms & ~deny.value) | allow.value
             channel_type = type(channel)
             totals[channel_type] += 1
-            if not perms.read_messages:
+            if not perms & READ_MESSAGES:
                 secret[channel_type] += 1
-            elif isinstance(channel, discord.VoiceChannel) and (
-                not perms.connect or not perms.speak
+            elif (
+                isinstance(channel, discord.VoiceChannel)
+                and perms & VOICE_ACCESS != VOICE_ACCESS
             ):
                 secret[channel_type] += 1
 
-        member_by_status = Counter(str(m.status) for m in guild.members)
+        online = idle = dnd = offline = bots = 0
+        for member in guild.members:
+            status = member.status
+            if status is discord.Status.online:
+                online += 1
+            elif status is discord.Status.idle:
+                idle += 1
+            elif status is discord.Status.dnd:
+                dnd += 1
+            elif status is discord.Status.offline:
+                offline += 1
+            bots += member.bot
 
         e = discord.Embed()
         e.title = guild.name
@@ -305,92 +400,66 @@ class Meta(commands.Cog):
         if guild.icon:
             e.set_thumbnail(url=guild.icon_url)
 
-        channel_info = []
-        key_to_emoji = {
-            discord.TextChannel: "<:TextChannel:745076999160070296>",
-            discord.VoiceChannel: "<:VoiceChannel:745077018080575580>",
-        }
-        for key, total in totals.items():
-            secrets = secret[key]
-            try:
-                emoji = key_to_emoji[key]
-            except KeyError:
-                continue
-
-            if secrets:
-                channel_info.append(f"{emoji} {total} ({secrets} locked)")
-            else:
-                channel_info.append(f"{emoji} {total}")
+        channel_info = "\n".join(
+            f"{emoji} {totals[key]} ({secret[key]} locked)"
+            if secret[key]
+            else f"{emoji} {totals[key]}"
+            for key, emoji in CHANNEL_EMOJI.items()
+            if key in totals
+        )
 
-        info = []
         features = set(guild.features)
-        all_features = {
-            "PARTNERED": "Partnered",
-            "VERIFIED": "Verified",
-            "DISCOVERABLE": "Server Discovery",
-            "COMMUNITY": "Community Server",
-            "FEATURED": "Featured.",
-            "WELCOME_SCREEN_ENABLED": "Welcome Screen",
-            "INVITE_SPLASH": "Invite Splash",
-            "VIP_REGIONS": "VIP Voice Servers",
-            "VANITY_URL": "Vanity Invite",
-            "COMMERCE": "Commerce",
-            "LURKABLE": "Lurkable",
-            "NEWS": "News Channels",
-            "ANIMATED_ICON": "Animated Icon",
-            "BANNER": "Banner",
-        }
-
-        for feature, label in all_features.items():
-            if feature in features:
-                info.append(f"{ctx.tick(True)}: {label}")
+        tick = ctx.tick(True)
+        info = [
+            f"{tick}: {label}"
+            for feature, label in ALL_FEATURES.items()
+            if feature in features
+        ]
 
         if info:
             e.add_field(name="Features", value="\n".join(info))
 
-        e.add_field(name="Channels", value="\n".join(channel_info))
+        e.add_field(name="Channels", value=channel_info)
 
         if guild.premium_tier != 0:
             boosts = (
                 f"Level {guild.premium_tier}\n{guild.premium_subscription_count} boosts"
             )
-            last_boost = max(
-                guild.members, key=lambda m: m.premium_since or guild.created_at
-            )
-            if last_boost.premium_since is not None:
+            boosters = guild.premium_subscribers
+            if boosters:
+                last_boost = max(boosters, key=lambda m: m.premium_since)
                 boosts = f"{boosts}\nLast Boost: {last_boost} ({time.human_timedelta(last_boost.premium_since, accuracy=2)})"
             e.add_field(name="Boosts", value=boosts, inline=False)
 
-        bots = sum(m.bot for m in guild.members)
         fmt = (
-            f'<:Online:745077502740791366> {member_by_status["online"]} '
-            f'<:Idle:745077548379013193> {member_by_status["idle"]} '
-            f'<:DnD:745077524446314507> {member_by_status["dnd"]} '
-            f'<:Offline:745077513826467991> {member_by_status["offline"]}\n'
-            f"Total: {guild.member_count} ({formats.plural(bots):bot})"
+            f"<:Online:745077502740791366> {online} "
+            f"<:Idle:745077548379013193> {idle} "
+            f"<:DnD:745077524446314507> {dnd} "
+            f"<:Offline:745077513826467991> {offline}\n"
+            f"Total: {guild.member_count} ({bots} bot{'s' if bots != 1 else ''})"
         )
 
         e.add_field(name="Members", value=fmt, inline=False)
         e.add_field(
             name="Roles",
-            value=", ".join(roles) if len(roles) < 10 else f"{len(roles)} roles",
+            value=_format_roles(guild.roles),
         )
 
-        emoji_stats = Counter()
+        regular = animated = disabled = animated_disabled = 0
         for emoji in guild.emojis:
             if emoji.animated:
-                emoji_stats["animated"] += 1
-                emoji_stats["animated_disabled"] += not emoji.available
+                animated += 1
+                animated_disabled += not emoji.available
             else:
-                emoji_stats["regular"] += 1
-                emoji_stats["disabled"] += not emoji.available
+                regular += 1
+                disabled += not emoji.available
 
         fmt = (
-            f'Regular: {emoji_stats["regular"]}/{guild.emoji_limit}\n'
-            f'Animated: {emoji_stats["animated"]}/{guild.emoji_limit}\n'
+            f"Regular: {regular}/{guild.emoji_limit}\n"
+            f"Animated: {animated}/{guild.emoji_limit}\n"
         )
-        if emoji_stats["disabled"] or emoji_stats["animated_disabled"]:
-            fmt = f'{fmt}Disabled: {emoji_stats["disabled"]} regular, {emoji_stats["animated_disabled"]} animated\n'
+        if disabled or animated_disabled:
+            fmt = f"{fmt}Disabled: {disabled} regular, {animated_disabled} animated\n"
 
         fmt = f"{fmt}Total Emoji: {len(guild.emojis)}/{guild.emoji_limit*2}"
         e.add_field(name="Emoji", value=fmt, inline=False)
@@ -402,17 +471,12 @@ class Meta(commands.Cog):
         e = discord.Embed(colour=member.colour)
         avatar = member.avatar_url_as(static_format="png")
         e.set_author(name=str(member), url=avatar)
-        allowed, denied = [], []
+        values = [value for _, value in permissions]
+        allowed = "\n".join(compress(PERMISSION_NAMES, values))
+        denied = "\n".join(compress(PERMISSION_NAMES, [not v for v in values]))
 
-        for name, value in permissions:
-            name = name.replace("_", " ").replace("guild", "server").title()
-            if value:
-                allowed.append(name)
-            else:
-                denied.append(name)
-
-        e.add_field(name="Allowed", value="\n".join(allowed))
-        e.add_field(name="Denied", value="\n".join(denied))
+        e.add_field(name="Allowed", value=allowed)
+        e.add_field(name="Denied", value=denied)
         await ctx.send(embed=e)
 
     @commands.command()
@@ -481,17 +545,8 @@ class Meta(commands.Cog):
     @commands.is_owner()
     async def join(self, ctx):
         """Joins a server."""
-        perms = discord.Permissions.all()
-        perms.administrator = False
-        stringy = f"""
-                   Okay you have two options:
-                   Invite me with managed permissions [here]({discord.utils.oauth_url(self.bot.user.id, perms)} 'WARNING: Creates a managed role in your server.').
-                   or...
-                   Invite me with no permissions, and you handle it with your own roles.
-                   [I can't promise I'll work until you fix my perms.]({discord.utils.oauth_url(self.bot.user.id)} 'I prefer this option, personally.').
-                   """
         embed = discord.Embed()
-        embed.description = textwrap.dedent(stringy)
+        embed.description = self.join_message
         await ctx.send(embed=embed)
 
     @commands.command()
@@ -564,7 +619,7 @@ class Meta(commands.Cog):
             ) from err
 
         await ctx.send(
-            f"```json\n{formats.clean_triple_backtick(formats.escape_invis_chars(json.dumps(msg, indent=2, ensure_ascii=False, sort_keys=True)))}\n```"
+            f"```json\n{formats.clean_triple_backtick(formats.escape_invis_chars(orjson.dumps(msg, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()))}\n```"
         )
 
     @raw_message.error